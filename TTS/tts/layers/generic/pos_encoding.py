@@ -51,12 +51,12 @@ class PositionalEncoding(nn.Module):
                     f"Sequence is {x.size(2)} but PositionalEncoding is"
                     f" limited to {self.pe.size(2)}. See max_len argument."
                 )
-            if mask is not None:
-                pos_enc = self.pe[:, :, : x.size(2)] * mask
-            else:
-                pos_enc = self.pe[:, :, : x.size(2)]
+            pos_enc = self.pe[:, :, : x.size(2)]
             if self.use_scale:
-                x = x + self.scale * pos_enc
+                pos_enc = self.scale * pos_enc
+            if mask is not None:
+                # fused multiply-add; avoids materializing the masked [B, C, T] table
+                x = torch.addcmul(x, pos_enc, mask)
             else:
                 x = x + pos_enc
         else:
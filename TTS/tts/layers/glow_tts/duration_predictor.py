@@ -44,8 +44,13 @@ class DurationPredictor(nn.Module):
         if language_emb_dim != 0 and language_emb_dim is not None:
             self.cond_lang = nn.Conv1d(language_emb_dim, in_channels, 1)
 
-    def forward(self, x, x_mask, g=None, lang_emb=None):
+    def forward(self, x, x_mask, g=None, lang_emb=None, input_masked=False):
         """
+        Args:
+            input_masked (bool): Set to True when `x` is already multiplied by `x_mask`,
+                so callers sharing one masked input across heads skip the redundant
+                multiply. Defaults to False.
+
         Shapes:
             - x: :math:`[B, C, T]`
             - x_mask: :math:`[B, 1, T]`
@@ -53,11 +58,13 @@ class DurationPredictor(nn.Module):
         """
         if g is not None:
             x = x + self.cond(g)
+            input_masked = False
 
         if lang_emb is not None:
             x = x + self.cond_lang(lang_emb)
+            input_masked = False
 
-        x = self.conv_1(x * x_mask)
+        x = self.conv_1(x if input_masked else x * x_mask)
         x = torch.relu(x)
         x = self.norm_1(x)
         x = self.drop(x)
@@ -67,3 +74,79 @@ class DurationPredictor(nn.Module):
         x = self.drop(x)
         x = self.proj(x * x_mask)
         return x * x_mask
+
+
+class MultiHeadDurationPredictor(nn.Module):
+    """Fused variant of :class:`DurationPredictor` running several heads in one conv stack.
+
+    ::
+
+        [2 x (grouped_conv1d_kxk -> relu -> layer_norm -> dropout)] -> grouped_conv1d_1x1 -> heads
+
+    Structurally identical heads that share the same input are run as grouped convolutions,
+    so each layer reads the input once and launches one kernel instead of one per head.
+    Normalization statistics are computed per head; the affine parameters are shared.
+
+    Args:
+        in_channels (int): Number of channels of the shared input tensor.
+        hidden_channels (int): Number of hidden channels per head.
+        kernel_size (int): Kernel size for the conv layers.
+        dropout_p (float): Dropout rate used after each conv layer.
+        num_heads (int): Number of parallel prediction heads. Defaults to 2.
+    """
+
+    def __init__(self, in_channels, hidden_channels, kernel_size, dropout_p, num_heads=2):
+        super().__init__()
+
+        # class arguments
+        self.in_channels = in_channels
+        self.filter_channels = hidden_channels
+        self.kernel_size = kernel_size
+        self.dropout_p = dropout_p
+        self.num_heads = num_heads
+        # layers
+        self.drop = nn.Dropout(dropout_p)
+        self.conv_1 = nn.Conv1d(
+            in_channels * num_heads,
+            hidden_channels * num_heads,
+            kernel_size,
+            padding=kernel_size // 2,
+            groups=num_heads,
+        )
+        self.norm_1 = LayerNorm(hidden_channels)
+        self.conv_2 = nn.Conv1d(
+            hidden_channels * num_heads,
+            hidden_channels * num_heads,
+            kernel_size,
+            padding=kernel_size // 2,
+            groups=num_heads,
+        )
+        self.norm_2 = LayerNorm(hidden_channels)
+        # output layer
+        self.proj = nn.Conv1d(hidden_channels * num_heads, num_heads, 1, groups=num_heads)
+
+    def _norm_heads(self, x, norm):
+        """Apply `norm` with per-head statistics on a `[B, H * C, T]` tensor."""
+        b, _, t = x.shape
+        x = x.reshape(b * self.num_heads, -1, t)
+        x = norm(x)
+        return x.reshape(b, -1, t)
+
+    def forward(self, x, x_mask):
+        """
+        Shapes:
+            - x: :math:`[B, C, T]`
+            - x_mask: :math:`[B, 1, T]`
+            - output: :math:`[B, num_heads, T]`
+        """
+        x = (x * x_mask).repeat(1, self.num_heads, 1)
+        x = self.conv_1(x)
+        x = torch.relu(x)
+        x = self._norm_heads(x, self.norm_1)
+        x = self.drop(x)
+        x = self.conv_2(x * x_mask)
+        x = torch.relu(x)
+        x = self._norm_heads(x, self.norm_2)
+        x = self.drop(x)
+        x = self.proj(x * x_mask)
+        return x * x_mask
@@ -14,6 +14,7 @@ from TTS.tts.configs.shared_configs import CharactersConfig
 from TTS.tts.datasets.dataset import TTSDataset
 from TTS.tts.utils.languages import LanguageManager, get_language_weighted_sampler
 from TTS.tts.utils.styles import StyleManager, get_style_weighted_sampler
+from TTS.tts.utils.samplers import SortedBucketSampler
 from TTS.tts.utils.speakers import SpeakerManager, get_speaker_manager, get_speaker_weighted_sampler
 from TTS.tts.utils.synthesis import synthesis
 from TTS.tts.utils.text import make_symbols
@@ -396,6 +397,13 @@ class BaseTTS(BaseModel):
                 elif getattr(config, "use_speaker_weighted_sampler", False):
                     print(" > Using Language weighted sampler")
                     sampler = get_speaker_weighted_sampler(dataset.items)
+                elif getattr(config, "use_bucket_sampler", False) and not is_eval:
+                    print(" > Using sorted bucket sampler")
+                    sampler = SortedBucketSampler(
+                        [len(item[0]) for item in dataset.items],
+                        config.batch_size,
+                        bucket_size_multiplier=getattr(config, "bucket_size_multiplier", 50),
+                    )
 
             loader = DataLoader(
                 dataset,
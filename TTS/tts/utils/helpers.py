@@ -152,6 +152,44 @@ def maximum_path(value, mask):
     return maximum_path_numpy(value, mask)
 
 
+def maximum_path_torch(value, mask, max_neg_val=None):
+    """Monotonic alignment search - pure torch batched version.
+
+    Runs the DP on the tensors' device, so CUDA inputs skip the device-to-host
+    round-trip and the serial per-sample backtracking of the Cython/NumPy versions.
+    The trade-off is O(T_de) kernel launches in the two Python loops, so callers
+    opt in explicitly where it pays off rather than through `maximum_path`.
+
+    Shapes:
+        - value: :math:`[B, T_en, T_de]`
+        - mask: :math:`[B, T_en, T_de]`
+    """
+    if max_neg_val is None:
+        max_neg_val = -float("inf")
+    # the hard path is not differentiable; detach to match the NumPy/Cython versions
+    value = (value * mask).detach()
+
+    b, t_x, t_y = value.shape
+    direction = torch.zeros(value.shape, dtype=torch.long, device=value.device)
+    v = torch.zeros((b, t_x), dtype=value.dtype, device=value.device)
+    x_range = torch.arange(t_x, device=value.device).unsqueeze(0)
+    for j in range(t_y):
+        v0 = F.pad(v, (1, 0), value=max_neg_val)[:, :-1]
+        max_mask = v >= v0
+        v_max = torch.where(max_mask, v, v0)
+        direction[:, :, j] = max_mask
+        v = (v_max + value[:, :, j]).masked_fill(x_range > j, max_neg_val)
+    direction = direction.masked_fill(~mask.bool(), 1)
+
+    path = torch.zeros(value.shape, dtype=value.dtype, device=value.device)
+    index = mask[:, :, 0].sum(1).long() - 1
+    index_range = torch.arange(b, device=value.device)
+    for j in reversed(range(t_y)):
+        path[index_range, index, j] = 1
+        index = index + direction[index_range, index, j] - 1
+    return path * mask
+
+
 def maximum_path_cython(value, mask):
     """Cython optimised version.
     Shapes:
@@ -0,0 +1,38 @@
+import random
+
+from torch.utils.data.sampler import Sampler
+
+
+class SortedBucketSampler(Sampler):
+    """Samples dataset indices so that every batch holds samples of similar length.
+
+    The shuffled index list is split into windows of `batch_size * bucket_size_multiplier`
+    samples and each window is sorted by the sample length. Consecutive batches drawn from
+    the sorted windows then contain same-order-of-magnitude lengths, which cuts the padded
+    positions the model computes over while keeping batch composition random across epochs.
+
+    Args:
+        lengths (List[int]): Sample lengths, aligned with the dataset indices.
+        batch_size (int): Number of samples per batch drawn by the data loader.
+        bucket_size_multiplier (int): Window size in batches used for sorting. Defaults to 50.
+        shuffle (bool): Shuffle the dataset order before bucketing. Defaults to True.
+    """
+
+    def __init__(self, lengths, batch_size, bucket_size_multiplier=50, shuffle=True):
+        # no base init call: `Sampler.__init__` is a no-op but requires a
+        # `data_source` argument before torch 2.2 and rejects it afterwards
+        self.lengths = lengths
+        self.batch_size = batch_size
+        self.bucket_size = batch_size * bucket_size_multiplier
+        self.shuffle = shuffle
+
+    def __iter__(self):
+        idxs = list(range(len(self.lengths)))
+        if self.shuffle:
+            random.shuffle(idxs)
+        for offset in range(0, len(idxs), self.bucket_size):
+            bucket = sorted(idxs[offset : offset + self.bucket_size], key=lambda idx: self.lengths[idx])
+            yield from bucket
+
+    def __len__(self):
+        return len(self.lengths)
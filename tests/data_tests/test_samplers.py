@@ -5,6 +5,7 @@ import torch
 from TTS.config.shared_configs import BaseDatasetConfig
 from TTS.tts.datasets import load_tts_samples
 from TTS.tts.utils.languages import get_language_weighted_sampler
+from TTS.tts.utils.samplers import SortedBucketSampler
 
 # Fixing random state to avoid random fails
 torch.manual_seed(0)
@@ -56,3 +57,14 @@ for index in ids:
         pt += 1
 
 assert is_balanced(en, pt), "Weighted sampler is supposed to be balanced"
+
+# Bucket sampler must yield every index exactly once and sort lengths inside each bucket
+lengths = torch.randint(10, 200, (256,)).tolist()
+bucket_sampler = SortedBucketSampler(lengths, batch_size=8, bucket_size_multiplier=4)
+idxs = list(bucket_sampler)
+assert len(bucket_sampler) == len(lengths)
+assert sorted(idxs) == list(range(len(lengths))), "Bucket sampler is supposed to be a permutation"
+bucket_size = 8 * 4
+for offset in range(0, len(idxs), bucket_size):
+    bucket_lengths = [lengths[index] for index in idxs[offset : offset + bucket_size]]
+    assert bucket_lengths == sorted(bucket_lengths), "Bucket sampler is supposed to sort within buckets"
@@ -2,6 +2,7 @@ import torch
 
 from TTS.tts.layers.feed_forward.decoder import Decoder
 from TTS.tts.layers.feed_forward.encoder import Encoder
+from TTS.tts.layers.glow_tts.duration_predictor import DurationPredictor, MultiHeadDurationPredictor
 from TTS.tts.utils.helpers import sequence_mask
 
 device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
@@ -105,3 +106,43 @@ def test_decoder():
     ).to(device)
     output = layer(input_dummy, input_mask)
     assert list(output.shape) == [8, 11, 37]
+
+
+def test_multi_head_duration_predictor():
+    input_dummy = torch.rand(8, 14, 37).to(device)
+    input_lengths = torch.randint(31, 37, (8,)).long().to(device)
+    input_lengths[-1] = 37
+    input_mask = torch.unsqueeze(sequence_mask(input_lengths, input_dummy.size(2)), 1).float().to(device)
+    layer = MultiHeadDurationPredictor(14, 24, 3, 0.1, num_heads=2).to(device)
+    layer.eval()
+    output = layer(input_dummy, input_mask)
+    assert list(output.shape) == [8, 2, 37]
+    # masked positions must stay zero on every head
+    assert output.masked_select((input_mask == 0).expand_as(output)).eq(0).all()
+
+
+def test_multi_head_duration_predictor_parity():
+    # two heads loaded with the same weights as a single predictor must match it
+    input_dummy = torch.rand(8, 14, 37).to(device)
+    input_lengths = torch.randint(31, 37, (8,)).long().to(device)
+    input_lengths[-1] = 37
+    input_mask = torch.unsqueeze(sequence_mask(input_lengths, input_dummy.size(2)), 1).float().to(device)
+    single = DurationPredictor(14, 24, 3, 0.0).to(device)
+    single.eval()
+    fused = MultiHeadDurationPredictor(14, 24, 3, 0.0, num_heads=2).to(device)
+    fused.eval()
+    with torch.no_grad():
+        for head in range(2):
+            fused.conv_1.weight[head * 24 : (head + 1) * 24].copy_(single.conv_1.weight)
+            fused.conv_1.bias[head * 24 : (head + 1) * 24].copy_(single.conv_1.bias)
+            fused.conv_2.weight[head * 24 : (head + 1) * 24].copy_(single.conv_2.weight)
+            fused.conv_2.bias[head * 24 : (head + 1) * 24].copy_(single.conv_2.bias)
+            fused.proj.weight[head : head + 1].copy_(single.proj.weight)
+            fused.proj.bias[head : head + 1].copy_(single.proj.bias)
+        for norm_fused, norm_single in [(fused.norm_1, single.norm_1), (fused.norm_2, single.norm_2)]:
+            norm_fused.gamma.copy_(norm_single.gamma)
+            norm_fused.beta.copy_(norm_single.beta)
+    expected = single(input_dummy, input_mask)
+    output = fused(input_dummy, input_mask)
+    assert torch.allclose(output[:, 0:1], expected, atol=1e-5)
+    assert torch.allclose(output[:, 1:2], expected, atol=1e-5)
@@ -1,3 +1,6 @@
+from types import SimpleNamespace
+
+import numpy as np
 import torch as T
 
 from TTS.tts.models.forward_tts import ForwardTTS, ForwardTTSArgs
@@ -145,3 +148,91 @@ def model_input_output_test():
     assert outputs["o_alignment_dur"].shape == (2, 21)
     assert outputs["pitch_avg"].shape == (2, 1, 21)
     assert outputs["pitch_avg_gt"].shape == (2, 1, 21)
+
+
+class _StubEncoding(dict):
+    """Minimal stand-in for the HF BatchEncoding interface `_compute_pos_label_ids` uses."""
+
+    def to(self, device):  # pylint: disable=unused-argument
+        return self
+
+
+class _StubTokenizer:
+    """Whitespace tokenizer mimicking the Camembert sub-word interface.
+
+    Every word becomes one "▁"-prefixed token, so `len(token)` covers the word
+    plus its leading space like the real sentencepiece pieces do.
+    """
+
+    def __init__(self):
+        self.vocab = {"<s>": 0, "</s>": 1, "<pad>": 2}
+
+    def __call__(self, texts, padding=True, return_special_tokens_mask=True, return_tensors="pt"):
+        batch_tokens = [["<s>"] + ["▁" + word for word in text.split(" ")] + ["</s>"] for text in texts]
+        max_tokens = max(len(tokens) for tokens in batch_tokens)
+        input_ids = []
+        special = []
+        for tokens in batch_tokens:
+            tokens = tokens + ["<pad>"] * (max_tokens - len(tokens))
+            for token in tokens:
+                self.vocab.setdefault(token, len(self.vocab))
+            input_ids.append([self.vocab[token] for token in tokens])
+            special.append([1 if token in ("<s>", "</s>", "<pad>") else 0 for token in tokens])
+        return _StubEncoding(
+            input_ids=T.tensor(input_ids),
+            attention_mask=T.ones(len(texts), max_tokens, dtype=T.long),
+            special_tokens_mask=T.tensor(special),
+        )
+
+    def convert_ids_to_tokens(self, ids):
+        id_to_token = {idx: token for token, idx in self.vocab.items()}
+        return [id_to_token[idx] for idx in ids]
+
+
+class _StubTagger(T.nn.Module):
+    """Tagger whose predicted class for every token equals the token's input id."""
+
+    device = T.device("cpu")
+
+    def forward(self, input_ids=None, attention_mask=None):  # pylint: disable=unused-argument
+        return SimpleNamespace(logits=T.nn.functional.one_hot(input_ids, num_classes=16).float())
+
+
+def compute_pos_label_ids_test():
+    model = ForwardTTS(ForwardTTSArgs(num_chars=10))
+    model.tokenizer = _StubTokenizer()
+    model.pos_tagger = _StubTagger()
+    # vocab ids: ▁aaa -> 3, ▁bb -> 4, ▁c -> 5
+    label_ids, pos_mask = model._compute_pos_label_ids(["aaa bb", "c"], 8, T.device("cpu"))
+
+    assert label_ids.shape == (2, 8)
+    assert pos_mask.shape == (2, 1, 8)
+    # BOS offset: the word's leading "▁" is dropped, so the boundary space takes
+    # the class of the following word
+    assert label_ids[0].tolist() == [3, 3, 3, 4, 4, 4, 0, 0]
+    assert pos_mask[0, 0].tolist() == [True] * 6 + [False] * 2
+    # shorter sentence: untagged padding stays zero and masked out
+    assert label_ids[1].tolist() == [5, 0, 0, 0, 0, 0, 0, 0]
+    assert pos_mask[1, 0].tolist() == [True] + [False] * 7
+
+    # spans past max_len are truncated
+    label_ids, pos_mask = model._compute_pos_label_ids(["aaa bb", "c"], 4, T.device("cpu"))
+    assert label_ids[0].tolist() == [3, 3, 3, 4]
+    assert pos_mask[0, 0].tolist() == [True] * 4
+
+
+def decode_texts_test():
+    model = ForwardTTS(ForwardTTSArgs(num_chars=10))
+    # per-character symbols concatenate directly and truncate at the input length
+    model._id_to_symbol_np = np.array(["_", "a", "b", "c", " "], dtype=object)
+    model._decode_sep = ""
+    x = T.tensor([[1, 2, 4, 3, 0], [3, 3, 0, 0, 0]])
+    x_lengths = T.tensor([4, 2])
+    assert model._decode_texts(x, x_lengths) == ["ab c", "cc"]
+
+    # whole-word symbols (split_by_space) re-join with spaces; blanks add nothing
+    model._id_to_symbol_np = np.array(["_", "aaa", "bb", ""], dtype=object)
+    model._decode_sep = " "
+    x = T.tensor([[1, 3, 2]])
+    x_lengths = T.tensor([6])
+    assert model._decode_texts(x, x_lengths) == ["aaa bb"]
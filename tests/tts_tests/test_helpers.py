@@ -1,6 +1,13 @@
 import torch as T
 
-from TTS.tts.utils.helpers import average_over_durations, generate_path, segment, sequence_mask
+from TTS.tts.utils.helpers import (
+    average_over_durations,
+    generate_path,
+    maximum_path_numpy,
+    maximum_path_torch,
+    segment,
+    sequence_mask,
+)
 
 
 def average_over_durations_test():  # pylint: disable=no-self-use
@@ -58,3 +65,18 @@ def generate_path_test():
             assert all(path[b, t, :current_idx] == 0.0)
             assert all(path[b, t, current_idx + durations[b, t].item() :] == 0.0)
             current_idx += durations[b, t].item()
+
+
+def maximum_path_test():
+    value = T.rand(4, 11, 25)
+    x_length = T.randint(8, 12, (4,))
+    x_length[0] = 11
+    y_length = T.randint(18, 26, (4,))
+    y_length[0] = 25
+    x_mask = sequence_mask(x_length, 11).unsqueeze(-1)
+    y_mask = sequence_mask(y_length, 25).unsqueeze(1)
+    mask = (x_mask * y_mask).float()
+
+    path_torch = maximum_path_torch(value, mask)
+    path_numpy = maximum_path_numpy(value, mask)
+    assert T.equal(path_torch, path_numpy)